@@ -31,6 +31,7 @@ import sys
 import re
 import time
 import importlib
+import functools
 
 from qtpy import QtCore
 from . import config
@@ -58,6 +59,8 @@ class Manager(QtCore.QObject):
 
       @signal sigConfigChanged: the configuration has changed, please reread your configuration
       @signal sigModulesChanged: the available modules have changed
+      @signal str str str sigModuleStateChanged: base, name and new state of a
+                                                 module whose state changed
       @signal sigModuleHasQuit: the module whose name is passed is now deactivated
       @signal sigAbortAll: abort all running things as quicly as possible
       @signal sigManagerQuit: the manager is quitting
@@ -68,6 +71,7 @@ class Manager(QtCore.QObject):
     # signal and slot delivery mechanisms.
     sigConfigChanged = QtCore.Signal()
     sigModulesChanged = QtCore.Signal()
+    sigModuleStateChanged = QtCore.Signal(str, str, str)
     sigModuleHasQuit = QtCore.Signal(object)
     sigLogDirChanged = QtCore.Signal(object)
     sigAbortAll = QtCore.Signal()
@@ -597,6 +601,8 @@ class Manager(QtCore.QObject):
 
         # Create object from class
         instance = modclass(manager=self, name=instanceName, config=configuration)
+        instance.module_state.sigStateChanged.connect(
+            functools.partial(self._moduleStateChanged, baseName, instanceName))
 
         with self.lock:
             self.tree['loaded'][baseName][instanceName] = instance
@@ -604,6 +610,15 @@ class Manager(QtCore.QObject):
         self.sigModulesChanged.emit()
         return instance
 
+    def _moduleStateChanged(self, base, name, event):
+        """ Forward a state transition of a module state machine.
+
+          @param str base: module base package (hardware, logic or gui)
+          @param str name: unique module name
+          @param object event: Fysom state transition description
+        """
+        self.sigModuleStateChanged.emit(base, name, event.dst)
+
     def connectModule(self, base, mkey):
         """ Connects the given module in mkey to main object with the help
             of base.
@@ -25,11 +25,16 @@ import numpy as np
 import os
 
 from collections import OrderedDict
+from core.module import BaseMixin
 from core.statusvariable import StatusVar
 from core.util.modules import get_main_dir
 from .errordialog import ErrorDialog
+from .ui_about import Ui_AboutDialog
+from .ui_console_settings import Ui_Dialog as Ui_ConsoleSettingsDialog
+from .ui_manager_window import Ui_MainWindow as Ui_ManagerMainWindow
+from .ui_module_widget import Ui_ModuleWidget
 from gui.guibase import GUIBase
-from qtpy import QtCore, QtWidgets, uic
+from qtpy import QtCore, QtWidgets
 from qtpy.QtGui import QPalette
 from qtpy.QtWidgets import QWidget
 
@@ -40,17 +45,25 @@ except ImportError:
 
 try:
     from git import Repo
-except:
+except ImportError:
     pass
 
 try:
     import pyqtgraph as pg
     _has_pyqtgraph = True
-except:
+except ImportError:
     _has_pyqtgraph = False
 
-# Rather than import the ui*.py file here, the ui*.ui file itself is
-# loaded by uic.loadUI in the QtGui classes below.
+logger = logging.getLogger(__name__)
+
+# The ui_*.py files are compiled from the corresponding ui_*.ui files, so the
+# widgets below do not have to parse the XML on every instantiation.
+# Regenerate them with tools/compile_ui.py whenever a *.ui file is changed.
+
+# link to the current commit and branch, shown in the about dialog and the
+# status bar
+_VERSION_HTML = ('<a href=\"https://github.com/Ulm-IQO/qudi/commit/{0}\"'
+                 ' style=\"color: cyan;\"> {0} </a>, on branch {1}')
 
 
 class ManagerGui(GUIBase):
@@ -87,8 +100,21 @@ class ManagerGui(GUIBase):
           @param dict config:
         """
         super().__init__(**kwargs)
-        self.modlist = list()
+        # module list widgets by (base, name)
+        self.modlist = dict()
+        self._pending_module_lists = dict()
+        # copy of the loaded and defined modules, see takeTreeSnapshot
+        self._tree_snapshot = {
+            'loaded': dict(), 'defined': dict(), 'startup': list()}
+        # (base, name) of loaded modules whose state changes are not pushed
+        self._polled_modules = set()
         self.modules = set()
+        self._software_version = None
+        self._csd = None
+        # tree nodes currently shown in the configuration tree widget
+        self._tree_nodes = ()
+        # last visibility of the manager window, False while minimised
+        self._mw_visible = False
 
     def on_activate(self):
         """ Activation method called on change to active state.
@@ -109,22 +135,17 @@ class ManagerGui(GUIBase):
             if 'useOpenGL' in self._manager.tree['global']:
                 pg.setConfigOption('useOpenGL',
                                    self._manager.tree['global']['useOpenGL'])
+        self.takeTreeSnapshot()
         self._mw = ManagerMainWindow()
         self.restoreWindowPos(self._mw)
         self.errorDialog = ErrorDialog(self)
         self._about = AboutDialog()
-        version = self.getSoftwareVersion()
+        version = _VERSION_HTML.format(*self.getSoftwareVersion())
         configFile = self._manager.configFile
-        self._about.label.setText(
-            '<a href=\"https://github.com/Ulm-IQO/qudi/commit/{0}\"'
-            ' style=\"color: cyan;\"> {0} </a>, on branch {1}.'.format(
-                version[0], version[1]))
+        self._about.label.setText('{0}.'.format(version))
         self.versionLabel = QtWidgets.QLabel()
         self.versionLabel.setText(
-            '<a href=\"https://github.com/Ulm-IQO/qudi/commit/{0}\"'
-            ' style=\"color: cyan;\"> {0} </a>,'
-            ' on branch {1}, configured from {2}'.format(
-                version[0], version[1], configFile))
+            '{0}, configured from {1}'.format(version, configFile))
         self.versionLabel.setOpenExternalLinks(True)
         self._mw.statusBar().addWidget(self.versionLabel)
         # Connect up the buttons.
@@ -138,8 +159,7 @@ class ManagerGui(GUIBase):
         self._mw.actionReset_to_default_layout.triggered.connect(self.resetToDefaultLayout)
 
         self._manager.sigShowManager.connect(self.show)
-        self._manager.sigConfigChanged.connect(self.updateConfigWidgets)
-        self._manager.sigModulesChanged.connect(self.updateConfigWidgets)
+        self._manager.sigConfigChanged.connect(self._onConfigChanged)
         self._manager.sigShutdownAcknowledge.connect(self.promptForShutdown)
         # Log widget
         self._mw.logwidget.setManager(self._manager)
@@ -154,14 +174,22 @@ class ManagerGui(GUIBase):
         self.sigLoadConfig.connect(self._manager.loadConfig)
         self.sigSaveConfig.connect(self._manager.saveConfig)
         self.sigRealQuit.connect(self._manager.realQuit)
-        # Module state display
+        # Module state display. State changes are pushed by the manager, the
+        # timer only polls modules without a local state machine (remote)
+        # and only runs while there are any and the manager window is visible.
         self.checkTimer = QtCore.QTimer()
-        self.checkTimer.start(1000)
+        self.checkTimer.timeout.connect(self.pollModuleStates)
+        self._mw.sigVisibilityChanged.connect(self.updateCheckTimer)
+        self.updateCheckTimer(
+            self._mw.isVisible() and not self._mw.isMinimized())
         self.updateGUIModuleList()
         # IPython console widget
         self.startIPython()
         self.updateIPythonModuleList()
         self.startIPythonWidget()
+        # configuration tree, namespace and module states follow module changes
+        self.updateConfigWidgets()
+        self._manager.sigModulesChanged.connect(self._onModulesChanged)
         # thread widget
         self._mw.threadWidget.threadListView.setModel(self._manager.tm)
         # remote widget
@@ -191,22 +219,45 @@ class ManagerGui(GUIBase):
         """
         self.stopIPythonWidget()
         self.stopIPython()
+        self._mw.sigVisibilityChanged.disconnect()
         self.checkTimer.stop()
-        if len(self.modlist) > 0:
-            self.checkTimer.timeout.disconnect()
+        self.checkTimer.timeout.disconnect()
+        for widget in self.modlist.values():
+            self._manager.sigModuleStateChanged.disconnect(
+                widget.moduleStateChanged)
+            widget.sigLoadThis.disconnect()
+            widget.sigReloadThis.disconnect()
+            widget.sigDeactivateThis.disconnect()
+            widget.sigCleanupStatus.disconnect()
+        self.modlist = dict()
+        for scroll in self._pending_module_lists:
+            scroll.removeEventFilter(self)
+        self._pending_module_lists = dict()
+        for loghandler in logging.getLogger().handlers:
+            if isinstance(loghandler, core.logger.QtLogHandler):
+                loghandler.sigLoggedMessage.disconnect(self.handleLogEntry)
+        self._manager.sigShowManager.disconnect(self.show)
+        self._manager.sigConfigChanged.disconnect(self._onConfigChanged)
+        self._manager.sigModulesChanged.disconnect(self._onModulesChanged)
+        self._manager.sigShutdownAcknowledge.disconnect(self.promptForShutdown)
         self.sigStartModule.disconnect()
         self.sigReloadModule.disconnect()
+        self.sigCleanupStatus.disconnect()
         self.sigStopModule.disconnect()
         self.sigLoadConfig.disconnect()
         self.sigSaveConfig.disconnect()
+        self.sigRealQuit.disconnect()
         self._mw.actionQuit.triggered.disconnect()
         self._mw.actionLoad_configuration.triggered.disconnect()
+        self._mw.actionReload_current_configuration.triggered.disconnect()
         self._mw.actionSave_configuration.triggered.disconnect()
         self._mw.action_Load_all_modules.triggered.disconnect()
         self._mw.actionAbout_Qt.triggered.disconnect()
         self._mw.actionAbout_Qudi.triggered.disconnect()
+        self._mw.actionReset_to_default_layout.triggered.disconnect()
         self.saveWindowPos(self._mw)
         self._mw.close()
+        self._tree_nodes = ()
 
     def show(self):
         """Show the window and bring it t the top.
@@ -289,13 +340,11 @@ class ManagerGui(GUIBase):
         })
         if _has_pyqtgraph:
             self.namespace['pg'] = pg
-        self.updateIPythonModuleList()
         self.kernel.gui = 'qt4'
         self.log.info('IPython has kernel {0}'.format(
             self.kernel_manager.has_kernel))
         self.log.info('IPython kernel alive {0}'.format(
             self.kernel_manager.is_alive()))
-        self._manager.sigModulesChanged.connect(self.updateIPythonModuleList)
 
     def startIPythonWidget(self):
         """ Create an IPython console widget and connect it to an IPython
@@ -316,15 +365,9 @@ Go, play.
         self._mw.consolewidget.banner = banner
         # font size
         self.consoleSetFontSize(self.consoleFontSize)
-        # settings
-        self._csd = ConsoleSettingsDialog()
-        self._csd.accepted.connect(self.consoleApplySettings)
-        self._csd.rejected.connect(self.consoleKeepSettings)
-        self._csd.buttonBox.button(
-            QtWidgets.QDialogButtonBox.Apply).clicked.connect(
-                self.consoleApplySettings)
-        self._mw.actionConsoleSettings.triggered.connect(self._csd.exec_)
-        self.consoleKeepSettings()
+        # settings, the dialog is created when it is opened for the first time
+        self._csd = None
+        self._mw.actionConsoleSettings.triggered.connect(self._openConsoleSettings)
 
         self._mw.consolewidget.kernel_manager = self.kernel_manager
         self._mw.consolewidget.kernel_client = \
@@ -342,28 +385,101 @@ Go, play.
     def stopIPythonWidget(self):
         """ Disconnect the IPython widget from the kernel.
         """
+        self._mw.actionConsoleSettings.triggered.disconnect()
+        if self._csd is not None:
+            self._csd.accepted.disconnect()
+            self._csd.rejected.disconnect()
+            self._csd.buttonBox.button(
+                QtWidgets.QDialogButtonBox.Apply).clicked.disconnect()
+            self._csd = None
         self._mw.consolewidget.kernel_client.stop_channels()
 
-    def updateIPythonModuleList(self):
+    def takeTreeSnapshot(self):
+        """ Copy the loaded, defined and startup modules from the manager
+            tree.
+
+            The copy is taken under the manager lock once per change and is
+            read by everything in this GUI that needs the modules, instead
+            of each of them walking the live manager tree.
+        """
+        with self._manager.lock:
+            self._tree_snapshot = {
+                part: {base: dict(modules)
+                       for base, modules in self._manager.tree[part].items()}
+                for part in ('loaded', 'defined')}
+            self._tree_snapshot['startup'] = list(
+                self._manager.tree['global']['startup'])
+        # the manager only forwards state changes of the local modules it
+        # configured itself, type() also keeps remote proxies from passing
+        self._polled_modules = {
+            (base, name)
+            for base, modules in self._tree_snapshot['loaded'].items()
+            for name, module in modules.items()
+            if not issubclass(type(module), BaseMixin)}
+
+    def _onConfigChanged(self):
+        """ Update the module snapshot and the configuration tree.
+        """
+        self.takeTreeSnapshot()
+        self.updateConfigWidgets()
+
+    def _onModulesChanged(self):
+        """ Update the IPython namespace, the loaded modules in the
+            configuration tree and the module widgets with a single walk over
+            the loaded modules.
+        """
+        self.takeTreeSnapshot()
+        loaded = dict()
+        loaded_nodes = list()
+        for base, modules in self._tree_snapshot['loaded'].items():
+            loaded.update(modules)
+            loaded_nodes.append((base, self.treeNodes(modules)))
+        self.updateIPythonModuleList(loaded)
+        self.showConfigNodes(tuple(
+            (label, tuple(loaded_nodes)) if label == 'loaded' else (label, subnodes)
+            for label, subnodes in self._tree_nodes))
+        self.checkModuleStates()
+        # isVisible() is still True while the window is minimised
+        self.updateCheckTimer(self._mw_visible)
+
+    def updateIPythonModuleList(self, loaded=None):
         """Remove non-existing modules from namespace,
             add new modules to namespace, update reloaded modules
+
+          @param dict loaded: optional, all loaded modules by name. Collected
+                              from the module snapshot if not given.
         """
-        currentModules = set()
-        newNamespace = dict()
-        for base in ['hardware', 'logic', 'gui']:
-            for module in self._manager.tree['loaded'][base]:
-                currentModules.add(module)
-                newNamespace[module] = self._manager.tree[
-                    'loaded'][base][module]
-        discard = self.modules - currentModules
-        self.namespace.update(newNamespace)
-        for module in discard:
+        if loaded is None:
+            loaded = dict()
+            for modules in self._tree_snapshot['loaded'].values():
+                loaded.update(modules)
+        # only touch the namespace for removed, added and reloaded modules
+        for module in self.modules.difference(loaded):
             self.namespace.pop(module, None)
-        self.modules = currentModules
+        self.namespace.update(
+            (module, instance) for module, instance in loaded.items()
+            if self.namespace.get(module) is not instance)
+        self.modules = set(loaded)
+
+    @QtCore.Slot()
+    def _openConsoleSettings(self):
+        """ Show the console settings dialog, create it on first use.
+        """
+        if self._csd is None:
+            self._csd = ConsoleSettingsDialog()
+            self._csd.accepted.connect(self.consoleApplySettings)
+            self._csd.rejected.connect(self.consoleKeepSettings)
+            self._csd.buttonBox.button(
+                QtWidgets.QDialogButtonBox.Apply).clicked.connect(
+                    self.consoleApplySettings)
+            self.consoleKeepSettings()
+        self._csd.exec_()
 
     def consoleKeepSettings(self):
         """ Write old values into config dialog.
         """
+        if self._csd is None:
+            return
         self._csd.fontSizeBox.setProperty('value', self.consoleFontSize)
 
     def consoleApplySettings(self):
@@ -372,22 +488,72 @@ Go, play.
         self.consoleSetFontSize(self._csd.fontSizeBox.value())
 
     def consoleSetFontSize(self, fontsize):
+        """ Set the font size of the console.
+
+            Resetting the font re-renders the whole console content, so
+            nothing is done if the console already shows this size. The
+            shown font is checked since zooming the console changes it
+            without updating the font_size trait.
+
+          @param int fontsize: font size of the console
+        """
         self._mw.consolewidget.font_size = fontsize
         self.consoleFontSize = fontsize
+        if fontsize == self._mw.consolewidget.font.pointSize():
+            return
         self._mw.consolewidget.reset_font()
 
     def updateConfigWidgets(self):
-        """ Clear and refill the tree widget showing the configuration.
+        """ Update the tree widget showing the configuration.
         """
-        self.fillTreeWidget(self._mw.treeWidget, self._manager.tree)
+        with self._manager.lock:
+            nodes = self.treeNodes(self._manager.tree)
+        self.showConfigNodes(nodes)
+
+    def showConfigNodes(self, nodes):
+        """ Show tree nodes in the tree widget showing the configuration.
+
+            Nothing is done if the shown content did not change, otherwise
+            only the differing items are changed.
+
+          @param tuple nodes: tree nodes as from treeNodes
+        """
+        if nodes == self._tree_nodes:
+            return
+        self.updateTreeWidget(self._mw.treeWidget, self._tree_nodes, nodes)
+        self._tree_nodes = nodes
 
     def updateGUIModuleList(self):
-        """ Clear and refill the module list widget
+        """ Fill the module list widgets.
+
+            The module widgets of a category are only created once its list
+            is shown for the first time.
         """
         # self.clearModuleList(self)
-        self.fillModuleList(self._mw.guilayout, 'gui')
-        self.fillModuleList(self._mw.logiclayout, 'logic')
-        self.fillModuleList(self._mw.hwlayout, 'hardware')
+        self._pending_module_lists = {
+            self._mw.guiscroll: (self._mw.guilayout, 'gui'),
+            self._mw.logicscroll: (self._mw.logiclayout, 'logic'),
+            self._mw.hwscroll: (self._mw.hwlayout, 'hardware')
+        }
+        for scroll in list(self._pending_module_lists):
+            if scroll.isVisible():
+                self.fillModuleList(*self._pending_module_lists.pop(scroll))
+            else:
+                scroll.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        """ Fill a module list widget when it is shown for the first time.
+
+          @param QObject obj: watched object the event was sent to
+          @param QEvent event: the event
+
+          @return bool: False, the event is always passed on
+        """
+        if (event.type() == QtCore.QEvent.Show
+                and obj in self._pending_module_lists):
+            obj.removeEventFilter(self)
+            self.fillModuleList(*self._pending_module_lists.pop(obj))
+        return False
 
     def fillModuleList(self, layout, base):
         """ Fill the module list widget with module widgets for defined gui
@@ -397,74 +563,166 @@ Go, play.
                                  module widgest should be addad
           @param str base: module category to fill
         """
-        for module in self._manager.tree['defined'][base]:
-            if module not in self._manager.tree['global']['startup']:
+        startup = self._tree_snapshot['startup']
+        widgets = dict()
+        for module in self._tree_snapshot['defined'][base]:
+            if module not in startup and (base, module) not in self.modlist:
                 widget = ModuleListItem(self._manager, base, module)
-                self.modlist.append(widget)
-                layout.addWidget(widget)
                 widget.sigLoadThis.connect(self.sigStartModule)
                 widget.sigReloadThis.connect(self.sigReloadModule)
                 widget.sigDeactivateThis.connect(self.sigStopModule)
                 widget.sigCleanupStatus.connect(self.sigCleanupStatus)
-                self.checkTimer.timeout.connect(widget.checkModuleState)
+                widget.checkModuleState(self._tree_snapshot['loaded'][base])
+                widgets[(base, module)] = widget
+        # add all widgets with repaints suspended to get a single layout pass
+        scroll = layout.parentWidget()
+        scroll.setUpdatesEnabled(False)
+        for widget in widgets.values():
+            layout.addWidget(widget)
+        self.modlist.update(widgets)
+        scroll.setUpdatesEnabled(True)
+        scroll.update()
+
+    def checkModuleStates(self):
+        """ Update the state display of all module widgets.
+        """
+        loaded = self._tree_snapshot['loaded']
+        for widget in self.modlist.values():
+            widget.checkModuleState(loaded.get(widget.base, {}))
+
+    def pollModuleStates(self):
+        """ Update the state display of the module widgets whose module state
+            changes are not pushed by the manager.
+        """
+        loaded = self._tree_snapshot['loaded']
+        for base, name in self._polled_modules:
+            widget = self.modlist.get((base, name))
+            if widget is not None:
+                widget.checkModuleState(loaded.get(base, {}))
+
+    @QtCore.Slot(bool)
+    def updateCheckTimer(self, visible):
+        """ Run the module state check timer only while the manager window is
+            visible and there are modules that have to be polled.
+
+          @param bool visible: whether the manager window is visible
+        """
+        self._mw_visible = visible
+        if visible and self._polled_modules:
+            if not self.checkTimer.isActive():
+                self.pollModuleStates()
+                self.checkTimer.start(1000)
+        else:
+            self.checkTimer.stop()
 
-    def fillTreeItem(self, item, value):
-        """ Recursively fill a QTreeWidgeItem with the contents from a
-            dictionary.
+    def treeNodes(self, value):
+        """ Convert the contents of a dictionary into the labels shown in a
+            QTreeWidget.
 
-          @param QTreeWidgetItem item: the widget item to fill
-          @param (dict, list, etc) value: value to fill in
-        """
-        item.setExpanded(True)
-        if type(value) is OrderedDict or type(value) is dict:
-            for key in value:
-                child = QtWidgets.QTreeWidgetItem()
-                child.setText(0, key)
-                item.addChild(child)
-                self.fillTreeItem(child, value[key])
-        elif type(value) is list:
+          @param (dict, list, etc) value: value to convert
+
+          @return tuple: one (label, child nodes) pair per child item
+        """
+        if isinstance(value, dict):
+            return tuple((key, self.treeNodes(val)) for key, val in value.items())
+        elif isinstance(value, list):
+            nodes = list()
             for val in value:
-                child = QtWidgets.QTreeWidgetItem()
-                item.addChild(child)
-                if type(val) is dict:
-                    child.setText(0, '[dict]')
-                    self.fillTreeItem(child, val)
-                elif type(val) is OrderedDict:
-                    child.setText(0, '[odict]')
-                    self.fillTreeItem(child, val)
-                elif type(val) is list:
-                    child.setText(0, '[list]')
-                    self.fillTreeItem(child, val)
+                if isinstance(val, dict):
+                    label = '[odict]' if type(val) is OrderedDict else '[dict]'
+                elif isinstance(val, list):
+                    label = '[list]'
                 else:
-                    child.setText(0, str(val))
-                child.setExpanded(True)
+                    nodes.append((str(val), ()))
+                    continue
+                nodes.append((label, self.treeNodes(val)))
+            return tuple(nodes)
         else:
-            child = QtWidgets.QTreeWidgetItem()
-            child.setText(0, str(value))
-            item.addChild(child)
+            return ((str(value), ()), )
+
+    def fillTreeItem(self, item, nodes):
+        """ Fill a QTreeWidgeItem with tree nodes.
+
+            All children of an item are created first and added in one go.
+            Nested nodes are processed from an explicit stack instead of by
+            recursion.
+
+          @param QTreeWidgetItem item: the widget item to fill
+          @param tuple nodes: (label, child nodes) pairs as from treeNodes
+        """
+        stack = [(item, nodes)]
+        while stack:
+            item, nodes = stack.pop()
+            item.setExpanded(True)
+            children = [QtWidgets.QTreeWidgetItem([label]) for label, _ in nodes]
+            item.addChildren(children)
+            stack.extend(
+                (child, subnodes)
+                for child, (_, subnodes) in zip(children, nodes) if subnodes)
+
+    def updateTreeItem(self, item, old, new):
+        """ Change the children of a QTreeWidgetItem from the old to the new
+            tree nodes, touching only the items that differ.
+
+          @param QTreeWidgetItem item: the widget item to update
+          @param tuple old: tree nodes currently shown in the item
+          @param tuple new: tree nodes that should be shown in the item
+        """
+        stack = [(item, old, new)]
+        while stack:
+            item, old, new = stack.pop()
+            if old == new:
+                continue
+            common = min(len(old), len(new))
+            for index in range(common):
+                (old_label, old_subnodes), (label, subnodes) = old[index], new[index]
+                child = item.child(index)
+                if label != old_label:
+                    child.setText(0, label)
+                stack.append((child, old_subnodes, subnodes))
+            for index in reversed(range(common, len(old))):
+                item.takeChild(index)
+            if len(new) > common:
+                self.fillTreeItem(item, new[common:])
+            elif new:
+                item.setExpanded(True)
 
     def getSoftwareVersion(self):
         """ Try to determine the software version in case the program is in
             a git repository.
+
+            The result is cached after the first call since it does not change
+            while Qudi is running.
         """
+        if self._software_version is not None:
+            return self._software_version
         try:
             repo = Repo(get_main_dir())
             branch = repo.active_branch
             rev = str(repo.head.commit)
-            return rev, str(branch)
+            self._software_version = (rev, str(branch))
 
         except Exception as e:
             print('Could not get git repo because:', e)
-            return 'unknown', -1
+            self._software_version = ('unknown', -1)
+        return self._software_version
 
-    def fillTreeWidget(self, widget, value):
-        """ Fill a QTreeWidget with the content of a dictionary
+    def updateTreeWidget(self, widget, old, new):
+        """ Update a QTreeWidget from the old to the new tree nodes
 
-          @param QTreeWidget widget: the tree widget to fill
-          @param dict,OrderedDict value: the dictionary to fill in
+          @param QTreeWidget widget: the tree widget to update
+          @param tuple old: tree nodes currently shown in the widget
+          @param tuple new: tree nodes that should be shown in the widget
         """
-        widget.clear()
-        self.fillTreeItem(widget.invisibleRootItem(), value)
+        # suspend repaints, signals and sorting while the items are changed
+        sorting = widget.isSortingEnabled()
+        widget.setUpdatesEnabled(False)
+        widget.blockSignals(True)
+        widget.setSortingEnabled(False)
+        self.updateTreeItem(widget.invisibleRootItem(), old, new)
+        widget.setSortingEnabled(sorting)
+        widget.blockSignals(False)
+        widget.setUpdatesEnabled(True)
 
     def reloadConfig(self):
         """  Reload the current config. """
@@ -516,21 +774,20 @@ Go, play.
             self.sigSaveConfig.emit(filename)
 
 
-class ManagerMainWindow(QtWidgets.QMainWindow):
+class ManagerMainWindow(QtWidgets.QMainWindow, Ui_ManagerMainWindow):
 
     """ This class represents the Manager Window.
+
+      @signal bool sigVisibilityChanged: window was shown (True) or hidden
     """
 
+    sigVisibilityChanged = QtCore.Signal(bool)
+
     def __init__(self):
         """ Create the Manager Window.
         """
-        # Get the path to the *.ui file
-        this_dir = os.path.dirname(__file__)
-        ui_file = os.path.join(this_dir, 'ui_manager_window.ui')
-
-        # Load it
         super(ManagerMainWindow, self).__init__()
-        uic.loadUi(ui_file, self)
+        self.setupUi(self)
         self.show()
 
         # Set up the layout
@@ -540,8 +797,20 @@ class ManagerMainWindow(QtWidgets.QMainWindow):
         self.logiclayout = QtWidgets.QVBoxLayout(self.logicscroll)
         self.hwlayout = QtWidgets.QVBoxLayout(self.hwscroll)
 
+    def showEvent(self, event):
+        """ Notify that the window is shown.
+        """
+        super().showEvent(event)
+        self.sigVisibilityChanged.emit(True)
+
+    def hideEvent(self, event):
+        """ Notify that the window is hidden, e.g. closed or minimized.
+        """
+        super().hideEvent(event)
+        self.sigVisibilityChanged.emit(False)
+
 
-class AboutDialog(QtWidgets.QDialog):
+class AboutDialog(QtWidgets.QDialog, Ui_AboutDialog):
 
     """ This class represents the Qudi About dialog.
     """
@@ -549,32 +818,22 @@ class AboutDialog(QtWidgets.QDialog):
     def __init__(self):
         """ Create Qudi About Dialog.
         """
-        # Get the path to the *.ui file
-        this_dir = os.path.dirname(__file__)
-        ui_file = os.path.join(this_dir, 'ui_about.ui')
-
-        # Load it
         super().__init__()
-        uic.loadUi(ui_file, self)
+        self.setupUi(self)
 
 
-class ConsoleSettingsDialog(QtWidgets.QDialog):
+class ConsoleSettingsDialog(QtWidgets.QDialog, Ui_ConsoleSettingsDialog):
 
     """ Create the SettingsDialog window, based on the corresponding *.ui
         file.
     """
 
     def __init__(self):
-        # Get the path to the *.ui file
-        this_dir = os.path.dirname(__file__)
-        ui_file = os.path.join(this_dir, 'ui_console_settings.ui')
-
-        # Load it
         super().__init__()
-        uic.loadUi(ui_file, self)
+        self.setupUi(self)
 
 
-class ModuleListItem(QtWidgets.QFrame):
+class ModuleListItem(QtWidgets.QFrame, Ui_ModuleWidget):
 
     """ This class represents a module widget in the Qudi module list.
 
@@ -597,17 +856,15 @@ class ModuleListItem(QtWidgets.QFrame):
           @param str basename: module category
           @param str modulename: unique module name
         """
-        # Get the path to the *.ui file
-        this_dir = os.path.dirname(__file__)
-        ui_file = os.path.join(this_dir, 'ui_module_widget.ui')
-
-        # Load it
         super().__init__()
-        uic.loadUi(ui_file, self)
+        self.setupUi(self)
 
         self.manager = manager
         self.name = modulename
         self.base = basename
+        self._last_state = None
+        self._exception_sticky = False
+        self.manager.sigModuleStateChanged.connect(self.moduleStateChanged)
 
         self.loadButton.setText('Load {0}'.format(self.name))
         # connect buttons
@@ -639,48 +896,77 @@ class ModuleListItem(QtWidgets.QFrame):
         """
         self.sigCleanupStatus.emit(self.base, self.name)
 
-    def checkModuleState(self):
+    @QtCore.Slot(str, str, str)
+    def moduleStateChanged(self, base, name, state):
+        """ Update the visual indications if the changed module is this one.
+
+          @param str base: module category of the changed module
+          @param str name: unique name of the changed module
+          @param str state: new state of the changed module
+        """
+        if base == self.base and name == self.name and not self._exception_sticky:
+            self.showModuleState(state)
+
+    def checkModuleState(self, loaded):
         """ Get the state of this module and update visual indications in the GUI.
 
+            Once getting the state failed, it is not tried again.
+
+          @param dict loaded: loaded modules of this module category by name
+        """
+        if self._exception_sticky:
+            return
+        try:
+            module = loaded.get(self.name)
+            state = 'not loaded' if module is None else module.module_state()
+        except Exception as e:
+            logger.warning('Cannot get state of {0} module {1}, it will not be '
+                           'checked again: {2}'.format(self.base, self.name, e))
+            state = 'exception, cannot get state'
+            self._exception_sticky = True
+        self.showModuleState(state)
+
+    def showModuleState(self, state):
+        """ Update visual indications of the module state in the GUI.
+
             Modules cannot be unloaded, but they can be deactivated.
 
             Once loaded, the "load <module>" button will remain checked and its text
             will be updated to indicate that loading is no longer possible.
+
+            The widgets are only changed if the state differs from the last
+            one shown.
+
+          @param str state: state of the module
         """
-        state = ''
-        if self.statusLabel.text() != 'exception, cannot get state':
-            try:
-                if (self.base in self.manager.tree['loaded']
-                        and self.name in self.manager.tree['loaded'][self.base]):
-                    state = self.manager.tree['loaded'][self.base][self.name].module_state()
-
-                    if state != 'deactivated':
-                        self.reloadButton.setEnabled(True)
-                        self.deactivateButton.setEnabled(True)
-                        self.cleanupButton.setEnabled(False)
-                        self.loadButton.setChecked(True)
-
-                        if self.base == 'gui':
-                            self.loadButton.setText('Show {0}'.format(self.name))
-                        else:
-                            self.loadButton.setText(self.name)
-                    else:
-                        self.reloadButton.setEnabled(True)
-                        self.deactivateButton.setEnabled(False)
-                        self.cleanupButton.setEnabled(True)
-                        self.loadButton.setChecked(True)
-
-                        self.loadButton.setText('Activate {0}'.format(self.name))
+        if state == self._last_state:
+            return
+        self._last_state = state
+
+        if state == 'not loaded':
+            self.reloadButton.setEnabled(False)
+            self.deactivateButton.setEnabled(False)
+            self.cleanupButton.setEnabled(True)
+        elif self._exception_sticky:
+            self.reloadButton.setEnabled(True)
+            self.deactivateButton.setEnabled(True)
+            self.cleanupButton.setEnabled(True)
+        elif state != 'deactivated':
+            self.reloadButton.setEnabled(True)
+            self.deactivateButton.setEnabled(True)
+            self.cleanupButton.setEnabled(False)
+            self.loadButton.setChecked(True)
+
+            if self.base == 'gui':
+                self.loadButton.setText('Show {0}'.format(self.name))
+            else:
+                self.loadButton.setText(self.name)
+        else:
+            self.reloadButton.setEnabled(True)
+            self.deactivateButton.setEnabled(False)
+            self.cleanupButton.setEnabled(True)
+            self.loadButton.setChecked(True)
 
-                else:
-                    state = 'not loaded'
-                    self.reloadButton.setEnabled(False)
-                    self.deactivateButton.setEnabled(False)
-                    self.cleanupButton.setEnabled(True)
-            except:
-                state = 'exception, cannot get state'
-                self.reloadButton.setEnabled(True)
-                self.deactivateButton.setEnabled(True)
-                self.cleanupButton.setEnabled(True)
-
-            self.statusLabel.setText(state)
+            self.loadButton.setText('Activate {0}'.format(self.name))
+
+        self.statusLabel.setText(state)
@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'gui/manager/ui_about.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when
+# tools/compile_ui.py is run again. Do not run pyuic5 directly, the
+# script adapts its output to qtpy and to relative icon paths.
+
+
+import os
+
+from qtpy import QtCore, QtGui, QtWidgets
+
+# icon paths in the .ui file are relative to its directory
+_ui_dir = os.path.dirname(__file__)
+
+
+class Ui_AboutDialog(object):
+    def setupUi(self, AboutDialog):
+        AboutDialog.setObjectName("AboutDialog")
+        AboutDialog.resize(664, 609)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.MinimumExpanding, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(AboutDialog.sizePolicy().hasHeightForWidth())
+        AboutDialog.setSizePolicy(sizePolicy)
+        self.gridLayout = QtWidgets.QGridLayout(AboutDialog)
+        self.gridLayout.setObjectName("gridLayout")
+        self.label_2 = QtWidgets.QLabel(AboutDialog)
+        font = QtGui.QFont()
+        font.setPointSize(20)
+        font.setBold(True)
+        font.setWeight(75)
+        self.label_2.setFont(font)
+        self.label_2.setObjectName("label_2")
+        self.gridLayout.addWidget(self.label_2, 0, 0, 1, 1)
+        self.buttonBox = QtWidgets.QDialogButtonBox(AboutDialog)
+        self.buttonBox.setOrientation(QtCore.Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QtWidgets.QDialogButtonBox.Ok)
+        self.buttonBox.setObjectName("buttonBox")
+        self.gridLayout.addWidget(self.buttonBox, 3, 0, 1, 1)
+        self.label = QtWidgets.QLabel(AboutDialog)
+        self.label.setOpenExternalLinks(True)
+        self.label.setObjectName("label")
+        self.gridLayout.addWidget(self.label, 1, 0, 1, 1)
+        self.tabWidget = QtWidgets.QTabWidget(AboutDialog)
+        self.tabWidget.setObjectName("tabWidget")
+        self.tab = QtWidgets.QWidget()
+        self.tab.setObjectName("tab")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.tab)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.aboutText = QtWidgets.QLabel(self.tab)
+        self.aboutText.setWordWrap(True)
+        self.aboutText.setObjectName("aboutText")
+        self.verticalLayout.addWidget(self.aboutText)
+        self.tabWidget.addTab(self.tab, "")
+        self.tab_2 = QtWidgets.QWidget()
+        self.tab_2.setObjectName("tab_2")
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout(self.tab_2)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.scrollArea = QtWidgets.QScrollArea(self.tab_2)
+        self.scrollArea.setWidgetResizable(True)
+        self.scrollArea.setObjectName("scrollArea")
+        self.scrollAreaWidgetContents = QtWidgets.QWidget()
+        self.scrollAreaWidgetContents.setGeometry(QtCore.QRect(0, 0, 620, 458))
+        self.scrollAreaWidgetContents.setObjectName("scrollAreaWidgetContents")
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout(self.scrollAreaWidgetContents)
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.aboutText_2 = QtWidgets.QLabel(self.scrollAreaWidgetContents)
+        self.aboutText_2.setWordWrap(True)
+        self.aboutText_2.setObjectName("aboutText_2")
+        self.verticalLayout_3.addWidget(self.aboutText_2)
+        self.scrollArea.setWidget(self.scrollAreaWidgetContents)
+        self.verticalLayout_2.addWidget(self.scrollArea)
+        self.tabWidget.addTab(self.tab_2, "")
+        self.tab_3 = QtWidgets.QWidget()
+        self.tab_3.setObjectName("tab_3")
+        self.verticalLayout_5 = QtWidgets.QVBoxLayout(self.tab_3)
+        self.verticalLayout_5.setObjectName("verticalLayout_5")
+        self.scrollArea_2 = QtWidgets.QScrollArea(self.tab_3)
+        self.scrollArea_2.setWidgetResizable(True)
+        self.scrollArea_2.setObjectName("scrollArea_2")
+        self.scrollAreaWidgetContents_2 = QtWidgets.QWidget()
+        self.scrollAreaWidgetContents_2.setGeometry(QtCore.QRect(0, 0, 165, 3508))
+        self.scrollAreaWidgetContents_2.setObjectName("scrollAreaWidgetContents_2")
+        self.verticalLayout_4 = QtWidgets.QVBoxLayout(self.scrollAreaWidgetContents_2)
+        self.verticalLayout_4.setObjectName("verticalLayout_4")
+        self.aboutText_3 = QtWidgets.QLabel(self.scrollAreaWidgetContents_2)
+        self.aboutText_3.setWordWrap(True)
+        self.aboutText_3.setOpenExternalLinks(True)
+        self.aboutText_3.setObjectName("aboutText_3")
+        self.verticalLayout_4.addWidget(self.aboutText_3)
+        self.scrollArea_2.setWidget(self.scrollAreaWidgetContents_2)
+        self.verticalLayout_5.addWidget(self.scrollArea_2)
+        self.tabWidget.addTab(self.tab_3, "")
+        self.gridLayout.addWidget(self.tabWidget, 2, 0, 1, 1)
+
+        self.retranslateUi(AboutDialog)
+        self.tabWidget.setCurrentIndex(1)
+        self.buttonBox.accepted.connect(AboutDialog.accept) # type: ignore
+        self.buttonBox.rejected.connect(AboutDialog.reject) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(AboutDialog)
+
+    def retranslateUi(self, AboutDialog):
+        _translate = QtCore.QCoreApplication.translate
+        AboutDialog.setWindowTitle(_translate("AboutDialog", "qudi: About Qudi"))
+        self.label_2.setText(_translate("AboutDialog", "Qudi"))
+        self.label.setText(_translate("AboutDialog", "Software Version"))
+        self.aboutText.setText(_translate("AboutDialog", "<html><head/><body><p>Qudi is a suite of tools for operating multi-instrument and multi-computer laboratory experiments. Originally built around a confocal fluorescence microscope experiments, it has grown to be a generally applicaple framework for controlling experiments.</p></body></html>"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab), _translate("AboutDialog", "About"))
+        self.aboutText_2.setText(_translate("AboutDialog", "<html><head/><body><p><span style=\" text-decoration: underline;\">Qudi is developed by the Institute for Quantum Optics at Ulm University. </span></p><p>Kay D. Jahnke</p><p>Jan M. Binder</p><p>Alexander Stark</p><p>Lachlan J, Rogers</p><p>Nikolas Tomek</p><p>Florian S. Frank</p><p>Mathias Metsch</p><p>Christoph Müller</p><p>Simon Schmitt</p><p>Thomas Unden</p><p>Jochen Scheuer</p><p>Ou Wang</p><p><span style=\" text-decoration: underline;\">External Contributors:</span></p><p>Tobias Gehring, DTU Copenhagen</p><p>...</p></body></html>"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_2), _translate("AboutDialog", "Credits"))
+        self.aboutText_3.setText(_translate("AboutDialog", "<html>\n"
+"<head/>\n"
+"<body>\n"
+"<p><span style=\" font-family:\'monospace\';\">\n"
+"Qudi is free software: you can redistribute it and/or modify it under the terms <br/>\n"
+"of the GNU General Public License as published by the Free Software Foundation,<br/>\n"
+"either version 3 of the License, or (at your option) any later version.\n"
+"</span></p>\n"
+"<p><span style=\" font-family:\'monospace\';\">\n"
+"Qudi is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;<br/>\n"
+"without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.<br/>\n"
+"See the GNU General Public License for more details.<br/>\n"
+"</span>\n"
+"</p><p><span style=\" font-family:\'monospace\';\">\n"
+"You should have received a copy of the GNU General Public License along with Qudi.<br/>\n"
+"If not, see\n"
+"</span>\n"
+"<a href=\"http://www.gnu.org/licenses/\"><span style=\" text-decoration: underline; color:#00ffff;\">http://www.gnu.org/licenses/</span></a>.<br/>\n"
+"</p>\n"
+"<p><span style=\" text-decoration: underline;\">\n"
+"Qudi is derived in parts from ACQ4, so here is its license:</span></p>\n"
+"<p><span style=\" font-family:\'monospace\';\">\n"
+"Permission is hereby granted, free of charge, to any person obtaining a copy <br/>\n"
+"of this software and associated documentation files (the &quot;Software&quot;), to deal <br/>\n"
+"in the Software without restriction, including without limitation the rights <br/>\n"
+"to use, copy, modify, merge, publish, distribute, sublicense, and/or sell <br/>\n"
+"copies of the Software, and to permit persons to whom the Software is <br/>\n"
+"furnished to do so, subject to the following conditions: <br/>\n"
+"<br/>\n"
+"The above copyright notice and this permission notice shall be included in all <br/>\n"
+"copies or substantial portions of the Software. <br/>\n"
+"<br/>\n"
+"THE SOFTWARE IS PROVIDED &quot;AS IS&quot;, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR <br/>\n"
+"IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, <br/>\n"
+"FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE <br/>\n"
+"AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER <br/>\n"
+"LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, <br/>\n"
+"OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE <br/>\n"
+"SOFTWARE.<br/>\n"
+"</span></p>\n"
+"<p><span style=\" font-family:\'monospace\'; text-decoration: underline;\">\n"
+"Parts of Qudi are derived from IPython, which is licensed as follows:\n"
+"</span></p>\n"
+"<p><span style=\" font-family:\'monospace\';\">\n"
+"<br/>\n"
+"This project is licensed under the terms of the Modified BSD License <br/>\n"
+"(also known as New or Revised or 3-Clause BSD), as follows: <br/>\n"
+"<br/>\n"
+"Copyright (c) 2015, IPython Development Team <br/>\n"
+"<br/>\n"
+"All rights reserved. <br/>\n"
+"<br/>\n"
+"Redistribution and use in source and binary forms, with or without <br/>\n"
+"modification, are permitted provided that the following conditions are met: <br/>\n"
+"<br/>\n"
+"Redistributions of source code must retain the above copyright notice, this <br/>\n"
+"list of conditions and the following disclaimer. <br/>\n"
+"<br/>\n"
+"Redistributions in binary form must reproduce the above copyright notice, this <br/>\n"
+"list of conditions and the following disclaimer in the documentation and/or <br/>\n"
+"other materials provided with the distribution. <br/>\n"
+"<br/>\n"
+"Neither the name of the IPython Development Team nor the names of its <br/>\n"
+"contributors may be used to endorse or promote products derived from this <br/>\n"
+"software without specific prior written permission. <br/>\n"
+"<br/>\n"
+"THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS &quot;AS IS&quot; AND <br/>\n"
+"ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED <br/>\n"
+"WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE <br/>\n"
+"DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT OWNER OR CONTRIBUTORS BE LIABLE <br/>\n"
+"FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL <br/>\n"
+"DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR <br/>\n"
+"SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER <br/>\n"
+"CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, <br/>\n"
+"OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE <br/>\n"
+"OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE. <br/>\n"
+"<br/>\n"
+"About the IPython Development Team <br/>\n"
+"<br/>\n"
+"The IPython Development Team is the set of all contributors to the IPython project. <br/>\n"
+"This includes all of the IPython subprojects. <br/><br/>The core team that coordinates development on GitHub can be found here: <br/>\n"
+"</span>\n"
+"<a href=\"https://github.com/ipython/\"><span style=\" text-decoration: underline; color:#2980b9;\">https://github.com/ipython/</span></a>\n"
+"<span style=\" font-family:\'monospace\';\">.<br/><br/></span>\n"
+"<span style=\" font-family:\'monospace\'; text-decoration: underline;\">\n"
+"Parts of Qudi are derived from SciPy, which is licensed as follows:\n"
+"</span></p>\n"
+"<p><span style=\" font-family:\'monospace\';\">\n"
+"Copyright (c) 2001, 2002 Enthought, Inc. <br/>\n"
+"All rights reserved. <br/>\n"
+"<br/>\n"
+"Copyright (c) 2003-2016 SciPy Developers. <br/>\n"
+"All rights reserved. <br/>\n"
+"<br/>\n"
+"Redistribution and use in source and binary forms, with or without <br/>\n"
+"modification, are permitted provided that the following conditions are met: <br/>\n"
+"<br/>\n"
+"a. Redistributions of source code must retain the above copyright notice, <br/>\n"
+"this list of conditions and the following disclaimer. <br/>\n"
+"b. Redistributions in binary form must reproduce the above copyright <br/>\n"
+"notice, this list of conditions and the following disclaimer in the <br/>\n"
+"documentation and/or other materials provided with the distribution. <br/>\n"
+"c. Neither the name of Enthought nor the names of the SciPy Developers <br/>\n"
+"may be used to endorse or promote products derived from this software <br/>\n"
+"without specific prior written permission. <br/>\n"
+"<br/>\n"
+"<br/>\n"
+"THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS &quot;AS IS&quot; <br/>\n"
+"AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE <br/>\n"
+"IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE <br/>\n"
+"ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDERS OR CONTRIBUTORS <br/>\n"
+"BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, <br/>\n"
+"OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF <br/>\n"
+"SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS <br/>\n"
+"INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN <br/>\n"
+"CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) <br/>\n"
+"ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF <br/>\n"
+"THE POSSIBILITY OF SUCH DAMAGE.<br/>\n"
+"<br/>\n"
+"</span></p>\n"
+"</body>\n"
+"</html>"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_3), _translate("AboutDialog", "License"))
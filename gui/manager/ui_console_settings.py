@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'gui/manager/ui_console_settings.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when
+# tools/compile_ui.py is run again. Do not run pyuic5 directly, the
+# script adapts its output to qtpy and to relative icon paths.
+
+
+import os
+
+from qtpy import QtCore, QtGui, QtWidgets
+
+# icon paths in the .ui file are relative to its directory
+_ui_dir = os.path.dirname(__file__)
+
+
+class Ui_Dialog(object):
+    def setupUi(self, Dialog):
+        Dialog.setObjectName("Dialog")
+        Dialog.resize(488, 289)
+        self.gridLayout_2 = QtWidgets.QGridLayout(Dialog)
+        self.gridLayout_2.setObjectName("gridLayout_2")
+        self.gridLayout = QtWidgets.QGridLayout()
+        self.gridLayout.setObjectName("gridLayout")
+        self.fontSizeBox = QtWidgets.QSpinBox(Dialog)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.fontSizeBox.sizePolicy().hasHeightForWidth())
+        self.fontSizeBox.setSizePolicy(sizePolicy)
+        self.fontSizeBox.setMinimum(5)
+        self.fontSizeBox.setProperty("value", 10)
+        self.fontSizeBox.setObjectName("fontSizeBox")
+        self.gridLayout.addWidget(self.fontSizeBox, 0, 1, 1, 1)
+        self.fontsizelabel = QtWidgets.QLabel(Dialog)
+        self.fontsizelabel.setObjectName("fontsizelabel")
+        self.gridLayout.addWidget(self.fontsizelabel, 0, 0, 1, 1)
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.gridLayout.addItem(spacerItem, 1, 0, 1, 1)
+        self.gridLayout_2.addLayout(self.gridLayout, 0, 0, 1, 1)
+        self.buttonBox = QtWidgets.QDialogButtonBox(Dialog)
+        self.buttonBox.setOrientation(QtCore.Qt.Horizontal)
+        self.buttonBox.setStandardButtons(QtWidgets.QDialogButtonBox.Apply|QtWidgets.QDialogButtonBox.Cancel|QtWidgets.QDialogButtonBox.Ok)
+        self.buttonBox.setObjectName("buttonBox")
+        self.gridLayout_2.addWidget(self.buttonBox, 1, 0, 1, 1)
+
+        self.retranslateUi(Dialog)
+        self.buttonBox.accepted.connect(Dialog.accept) # type: ignore
+        self.buttonBox.rejected.connect(Dialog.reject) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(Dialog)
+
+    def retranslateUi(self, Dialog):
+        _translate = QtCore.QCoreApplication.translate
+        Dialog.setWindowTitle(_translate("Dialog", "Dialog"))
+        self.fontsizelabel.setText(_translate("Dialog", "Font size"))
@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'gui/manager/ui_manager_window.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when
+# tools/compile_ui.py is run again. Do not run pyuic5 directly, the
+# script adapts its output to qtpy and to relative icon paths.
+
+
+import os
+
+from qtpy import QtCore, QtGui, QtWidgets
+
+# icon paths in the .ui file are relative to its directory
+_ui_dir = os.path.dirname(__file__)
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(1095, 681)
+        self.centralwidget = QtWidgets.QWidget(MainWindow)
+        self.centralwidget.setObjectName("centralwidget")
+        self.gridLayout = QtWidgets.QGridLayout(self.centralwidget)
+        self.gridLayout.setObjectName("gridLayout")
+        self.tabWidget = QtWidgets.QTabWidget(self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.tabWidget.sizePolicy().hasHeightForWidth())
+        self.tabWidget.setSizePolicy(sizePolicy)
+        self.tabWidget.setObjectName("tabWidget")
+        self.tabWidgetPage1 = QtWidgets.QWidget()
+        self.tabWidgetPage1.setObjectName("tabWidgetPage1")
+        self.gridLayout1 = QtWidgets.QGridLayout(self.tabWidgetPage1)
+        self.gridLayout1.setObjectName("gridLayout1")
+        self.scrollArea = QtWidgets.QScrollArea(self.tabWidgetPage1)
+        self.scrollArea.setWidgetResizable(True)
+        self.scrollArea.setObjectName("scrollArea")
+        self.guiscroll = QtWidgets.QWidget()
+        self.guiscroll.setGeometry(QtCore.QRect(0, 0, 967, 306))
+        self.guiscroll.setObjectName("guiscroll")
+        self.scrollArea.setWidget(self.guiscroll)
+        self.gridLayout1.addWidget(self.scrollArea, 1, 0, 1, 1)
+        self.tabWidget.addTab(self.tabWidgetPage1, "")
+        self.tabWidgetPage2 = QtWidgets.QWidget()
+        self.tabWidgetPage2.setObjectName("tabWidgetPage2")
+        self.gridLayout2 = QtWidgets.QGridLayout(self.tabWidgetPage2)
+        self.gridLayout2.setObjectName("gridLayout2")
+        self.scrollArea1 = QtWidgets.QScrollArea(self.tabWidgetPage2)
+        self.scrollArea1.setWidgetResizable(True)
+        self.scrollArea1.setObjectName("scrollArea1")
+        self.logicscroll = QtWidgets.QWidget()
+        self.logicscroll.setGeometry(QtCore.QRect(0, 0, 98, 28))
+        self.logicscroll.setObjectName("logicscroll")
+        self.scrollArea1.setWidget(self.logicscroll)
+        self.gridLayout2.addWidget(self.scrollArea1, 0, 0, 1, 1)
+        self.tabWidget.addTab(self.tabWidgetPage2, "")
+        self.tabWidgetPage3 = QtWidgets.QWidget()
+        self.tabWidgetPage3.setObjectName("tabWidgetPage3")
+        self.gridLayout3 = QtWidgets.QGridLayout(self.tabWidgetPage3)
+        self.gridLayout3.setObjectName("gridLayout3")
+        self.scrollArea2 = QtWidgets.QScrollArea(self.tabWidgetPage3)
+        self.scrollArea2.setWidgetResizable(True)
+        self.scrollArea2.setObjectName("scrollArea2")
+        self.hwscroll = QtWidgets.QWidget()
+        self.hwscroll.setGeometry(QtCore.QRect(0, 0, 967, 306))
+        self.hwscroll.setObjectName("hwscroll")
+        self.scrollArea2.setWidget(self.hwscroll)
+        self.gridLayout3.addWidget(self.scrollArea2, 0, 0, 1, 1)
+        self.tabWidget.addTab(self.tabWidgetPage3, "")
+        self.gridLayout.addWidget(self.tabWidget, 0, 0, 1, 1)
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.menubar = QtWidgets.QMenuBar(MainWindow)
+        self.menubar.setGeometry(QtCore.QRect(0, 0, 1095, 21))
+        self.menubar.setObjectName("menubar")
+        self.menuMenu = QtWidgets.QMenu(self.menubar)
+        self.menuMenu.setObjectName("menuMenu")
+        self.menuAbout = QtWidgets.QMenu(self.menubar)
+        self.menuAbout.setObjectName("menuAbout")
+        self.menuView = QtWidgets.QMenu(self.menubar)
+        self.menuView.setObjectName("menuView")
+        self.menuSettings = QtWidgets.QMenu(self.menubar)
+        self.menuSettings.setObjectName("menuSettings")
+        MainWindow.setMenuBar(self.menubar)
+        self.statusbar = QtWidgets.QStatusBar(MainWindow)
+        self.statusbar.setObjectName("statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+        self.configDisplayDockWidget = QtWidgets.QDockWidget(MainWindow)
+        self.configDisplayDockWidget.setEnabled(True)
+        self.configDisplayDockWidget.setObjectName("configDisplayDockWidget")
+        self.dockWidgetContents = QtWidgets.QWidget()
+        self.dockWidgetContents.setObjectName("dockWidgetContents")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.dockWidgetContents)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.treeWidget = QtWidgets.QTreeWidget(self.dockWidgetContents)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.treeWidget.sizePolicy().hasHeightForWidth())
+        self.treeWidget.setSizePolicy(sizePolicy)
+        self.treeWidget.setObjectName("treeWidget")
+        self.treeWidget.headerItem().setText(0, "1")
+        self.verticalLayout.addWidget(self.treeWidget)
+        self.configDisplayDockWidget.setWidget(self.dockWidgetContents)
+        MainWindow.addDockWidget(QtCore.Qt.DockWidgetArea(8), self.configDisplayDockWidget)
+        self.consoleDockWidget = QtWidgets.QDockWidget(MainWindow)
+        self.consoleDockWidget.setObjectName("consoleDockWidget")
+        self.consolewidget = RichJupyterWidget()
+        self.consolewidget.setObjectName("consolewidget")
+        self.consoleDockWidget.setWidget(self.consolewidget)
+        MainWindow.addDockWidget(QtCore.Qt.DockWidgetArea(2), self.consoleDockWidget)
+        self.logDockWidget = QtWidgets.QDockWidget(MainWindow)
+        self.logDockWidget.setObjectName("logDockWidget")
+        self.logwidget = LogWidget()
+        self.logwidget.setObjectName("logwidget")
+        self.logDockWidget.setWidget(self.logwidget)
+        MainWindow.addDockWidget(QtCore.Qt.DockWidgetArea(8), self.logDockWidget)
+        self.remoteDockWidget = QtWidgets.QDockWidget(MainWindow)
+        self.remoteDockWidget.setObjectName("remoteDockWidget")
+        self.remoteWidget = RemoteWidget()
+        self.remoteWidget.setObjectName("remoteWidget")
+        self.remoteDockWidget.setWidget(self.remoteWidget)
+        MainWindow.addDockWidget(QtCore.Qt.DockWidgetArea(8), self.remoteDockWidget)
+        self.threadDockWidget = QtWidgets.QDockWidget(MainWindow)
+        self.threadDockWidget.setObjectName("threadDockWidget")
+        self.threadWidget = ThreadWidget()
+        self.threadWidget.setObjectName("threadWidget")
+        self.threadDockWidget.setWidget(self.threadWidget)
+        MainWindow.addDockWidget(QtCore.Qt.DockWidgetArea(8), self.threadDockWidget)
+        self.configToolBar = QtWidgets.QToolBar(MainWindow)
+        self.configToolBar.setObjectName("configToolBar")
+        MainWindow.addToolBar(QtCore.Qt.TopToolBarArea, self.configToolBar)
+        self.moduleToolBar = QtWidgets.QToolBar(MainWindow)
+        self.moduleToolBar.setObjectName("moduleToolBar")
+        MainWindow.addToolBar(QtCore.Qt.TopToolBarArea, self.moduleToolBar)
+        self.actionLoad_configuration = QtWidgets.QAction(MainWindow)
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap(os.path.join(_ui_dir, "../../artwork/icons/oxygen/22x22/document-open.png")), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.actionLoad_configuration.setIcon(icon)
+        self.actionLoad_configuration.setObjectName("actionLoad_configuration")
+        self.actionSave_configuration = QtWidgets.QAction(MainWindow)
+        icon1 = QtGui.QIcon()
+        icon1.addPixmap(QtGui.QPixmap(os.path.join(_ui_dir, "../../artwork/icons/oxygen/22x22/document-save.png")), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.actionSave_configuration.setIcon(icon1)
+        self.actionSave_configuration.setObjectName("actionSave_configuration")
+        self.action_Load_all_modules = QtWidgets.QAction(MainWindow)
+        icon = QtGui.QIcon.fromTheme("media-playback-start")
+        self.action_Load_all_modules.setIcon(icon)
+        self.action_Load_all_modules.setObjectName("action_Load_all_modules")
+        self.actionStart_all_modules = QtWidgets.QAction(MainWindow)
+        icon = QtGui.QIcon.fromTheme("media-playback-start")
+        self.actionStart_all_modules.setIcon(icon)
+        self.actionStart_all_modules.setObjectName("actionStart_all_modules")
+        self.actionQuit = QtWidgets.QAction(MainWindow)
+        icon2 = QtGui.QIcon()
+        icon2.addPixmap(QtGui.QPixmap(os.path.join(_ui_dir, "../../artwork/icons/oxygen/22x22/application-exit.png")), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.actionQuit.setIcon(icon2)
+        self.actionQuit.setObjectName("actionQuit")
+        self.actionLogView = QtWidgets.QAction(MainWindow)
+        self.actionLogView.setCheckable(True)
+        self.actionLogView.setChecked(True)
+        icon3 = QtGui.QIcon()
+        icon3.addPixmap(QtGui.QPixmap(), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.actionLogView.setIcon(icon3)
+        self.actionLogView.setObjectName("actionLogView")
+        self.actionConsoleView = QtWidgets.QAction(MainWindow)
+        self.actionConsoleView.setCheckable(True)
+        self.actionConsoleView.setChecked(True)
+        self.actionConsoleView.setObjectName("actionConsoleView")
+        self.actionAbout_Qudi = QtWidgets.QAction(MainWindow)
+        icon4 = QtGui.QIcon()
+        icon4.addPixmap(QtGui.QPixmap(os.path.join(_ui_dir, "../../artwork/icons/qudiTheme/22x22/help-about.png")), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.actionAbout_Qudi.setIcon(icon4)
+        self.actionAbout_Qudi.setObjectName("actionAbout_Qudi")
+        self.actionAbout_Qt = QtWidgets.QAction(MainWindow)
+        self.actionAbout_Qt.setIcon(icon4)
+        self.actionAbout_Qt.setObjectName("actionAbout_Qt")
+        self.actionConfigurationView = QtWidgets.QAction(MainWindow)
+        self.actionConfigurationView.setCheckable(True)
+        self.actionConfigurationView.setChecked(False)
+        self.actionConfigurationView.setObjectName("actionConfigurationView")
+        self.actionReset_to_default_layout = QtWidgets.QAction(MainWindow)
+        self.actionReset_to_default_layout.setObjectName("actionReset_to_default_layout")
+        self.actionExport_log_as_HTML = QtWidgets.QAction(MainWindow)
+        icon = QtGui.QIcon.fromTheme("document-save-as")
+        self.actionExport_log_as_HTML.setIcon(icon)
+        self.actionExport_log_as_HTML.setObjectName("actionExport_log_as_HTML")
+        self.actionConsoleSettings = QtWidgets.QAction(MainWindow)
+        icon5 = QtGui.QIcon()
+        icon5.addPixmap(QtGui.QPixmap(os.path.join(_ui_dir, "../../artwork/icons/oxygen/22x22/utilities-terminal.png")), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.actionConsoleSettings.setIcon(icon5)
+        self.actionConsoleSettings.setObjectName("actionConsoleSettings")
+        self.actionThreadsView = QtWidgets.QAction(MainWindow)
+        self.actionThreadsView.setCheckable(True)
+        self.actionThreadsView.setObjectName("actionThreadsView")
+        self.actionRemoteView = QtWidgets.QAction(MainWindow)
+        self.actionRemoteView.setCheckable(True)
+        self.actionRemoteView.setObjectName("actionRemoteView")
+        self.actionReload_current_configuration = QtWidgets.QAction(MainWindow)
+        icon6 = QtGui.QIcon()
+        icon6.addPixmap(QtGui.QPixmap(os.path.join(_ui_dir, "../../artwork/icons/oxygen/22x22/view-refresh.png")), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.actionReload_current_configuration.setIcon(icon6)
+        self.actionReload_current_configuration.setObjectName("actionReload_current_configuration")
+        self.menuMenu.addAction(self.actionLoad_configuration)
+        self.menuMenu.addAction(self.actionReload_current_configuration)
+        self.menuMenu.addAction(self.actionSave_configuration)
+        self.menuMenu.addSeparator()
+        self.menuMenu.addAction(self.action_Load_all_modules)
+        self.menuMenu.addSeparator()
+        self.menuMenu.addAction(self.actionQuit)
+        self.menuAbout.addAction(self.actionAbout_Qudi)
+        self.menuAbout.addAction(self.actionAbout_Qt)
+        self.menuView.addAction(self.actionConfigurationView)
+        self.menuView.addAction(self.actionConsoleView)
+        self.menuView.addAction(self.actionLogView)
+        self.menuView.addAction(self.actionRemoteView)
+        self.menuView.addAction(self.actionThreadsView)
+        self.menuView.addAction(self.actionReset_to_default_layout)
+        self.menuSettings.addAction(self.actionConsoleSettings)
+        self.menubar.addAction(self.menuMenu.menuAction())
+        self.menubar.addAction(self.menuView.menuAction())
+        self.menubar.addAction(self.menuSettings.menuAction())
+        self.menubar.addAction(self.menuAbout.menuAction())
+        self.configToolBar.addAction(self.actionLoad_configuration)
+        self.configToolBar.addAction(self.actionSave_configuration)
+        self.configToolBar.addAction(self.actionReload_current_configuration)
+        self.moduleToolBar.addAction(self.action_Load_all_modules)
+
+        self.retranslateUi(MainWindow)
+        self.tabWidget.setCurrentIndex(0)
+        self.actionConsoleView.toggled['bool'].connect(self.consoleDockWidget.setVisible) # type: ignore
+        self.actionConfigurationView.toggled['bool'].connect(self.configDisplayDockWidget.setVisible) # type: ignore
+        self.actionLogView.toggled['bool'].connect(self.logDockWidget.setVisible) # type: ignore
+        self.actionThreadsView.toggled['bool'].connect(self.threadDockWidget.setVisible) # type: ignore
+        self.actionRemoteView.toggled['bool'].connect(self.remoteDockWidget.setVisible) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "qudi: Manager"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tabWidgetPage1), _translate("MainWindow", "GUI"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tabWidgetPage2), _translate("MainWindow", "Logic"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tabWidgetPage3), _translate("MainWindow", "Hardware"))
+        self.menuMenu.setTitle(_translate("MainWindow", "&Menu"))
+        self.menuAbout.setTitle(_translate("MainWindow", "Abo&ut"))
+        self.menuView.setTitle(_translate("MainWindow", "&View"))
+        self.menuSettings.setTitle(_translate("MainWindow", "Settings"))
+        self.configDisplayDockWidget.setWindowTitle(_translate("MainWindow", "Configuration"))
+        self.consoleDockWidget.setWindowTitle(_translate("MainWindow", "Console"))
+        self.logDockWidget.setWindowTitle(_translate("MainWindow", "Log"))
+        self.remoteDockWidget.setWindowTitle(_translate("MainWindow", "Remote modules"))
+        self.threadDockWidget.setWindowTitle(_translate("MainWindow", "Threads"))
+        self.configToolBar.setWindowTitle(_translate("MainWindow", "toolBar"))
+        self.moduleToolBar.setWindowTitle(_translate("MainWindow", "toolBar"))
+        self.actionLoad_configuration.setText(_translate("MainWindow", "&Load configuration"))
+        self.actionSave_configuration.setText(_translate("MainWindow", "&Save configuration"))
+        self.action_Load_all_modules.setText(_translate("MainWindow", " Load &all modules"))
+        self.actionStart_all_modules.setText(_translate("MainWindow", "Start all modules"))
+        self.actionQuit.setText(_translate("MainWindow", "&Quit Qudi"))
+        self.actionQuit.setToolTip(_translate("MainWindow", "Quit Qudi suite. Shortcut:Ctrl+Q"))
+        self.actionQuit.setShortcut(_translate("MainWindow", "Ctrl+Q"))
+        self.actionLogView.setText(_translate("MainWindow", "&Log"))
+        self.actionConsoleView.setText(_translate("MainWindow", "&Console"))
+        self.actionConsoleView.setToolTip(_translate("MainWindow", "Console settings"))
+        self.actionAbout_Qudi.setText(_translate("MainWindow", "&About Qudi"))
+        self.actionAbout_Qt.setText(_translate("MainWindow", "About &Qt"))
+        self.actionConfigurationView.setText(_translate("MainWindow", "C&onfiguration"))
+        self.actionReset_to_default_layout.setText(_translate("MainWindow", "&Reset to default layout"))
+        self.actionExport_log_as_HTML.setText(_translate("MainWindow", "&Export log as HTML"))
+        self.actionConsoleSettings.setText(_translate("MainWindow", "&Console"))
+        self.actionThreadsView.setText(_translate("MainWindow", "&Threads"))
+        self.actionRemoteView.setText(_translate("MainWindow", "R&emote"))
+        self.actionReload_current_configuration.setText(_translate("MainWindow", "&Reload current configuration"))
+from gui.manager.logwidget import LogWidget
+from gui.manager.remotewidget import RemoteWidget
+from gui.manager.threadwidget import ThreadWidget
+from qtconsole.rich_jupyter_widget import RichJupyterWidget
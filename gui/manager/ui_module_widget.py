@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'gui/manager/ui_module_widget.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when
+# tools/compile_ui.py is run again. Do not run pyuic5 directly, the
+# script adapts its output to qtpy and to relative icon paths.
+
+
+import os
+
+from qtpy import QtCore, QtGui, QtWidgets
+
+# icon paths in the .ui file are relative to its directory
+_ui_dir = os.path.dirname(__file__)
+
+
+class Ui_ModuleWidget(object):
+    def setupUi(self, ModuleWidget):
+        ModuleWidget.setObjectName("ModuleWidget")
+        ModuleWidget.resize(400, 74)
+        ModuleWidget.setMaximumSize(QtCore.QSize(400, 16777215))
+        ModuleWidget.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.gridLayout = QtWidgets.QGridLayout(ModuleWidget)
+        self.gridLayout.setObjectName("gridLayout")
+        self.deactivateButton = QtWidgets.QToolButton(ModuleWidget)
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap(os.path.join(_ui_dir, "../../artwork/icons/oxygen/22x22/application-exit.png")), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.deactivateButton.setIcon(icon)
+        self.deactivateButton.setObjectName("deactivateButton")
+        self.gridLayout.addWidget(self.deactivateButton, 0, 2, 1, 1)
+        self.reloadButton = QtWidgets.QToolButton(ModuleWidget)
+        icon1 = QtGui.QIcon()
+        icon1.addPixmap(QtGui.QPixmap(os.path.join(_ui_dir, "../../artwork/icons/oxygen/22x22/view-refresh.png")), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.reloadButton.setIcon(icon1)
+        self.reloadButton.setObjectName("reloadButton")
+        self.gridLayout.addWidget(self.reloadButton, 0, 1, 1, 1)
+        self.loadButton = QtWidgets.QPushButton(ModuleWidget)
+        self.loadButton.setCheckable(True)
+        self.loadButton.setObjectName("loadButton")
+        self.gridLayout.addWidget(self.loadButton, 0, 0, 1, 1)
+        self.statusLabel = QtWidgets.QLabel(ModuleWidget)
+        self.statusLabel.setObjectName("statusLabel")
+        self.gridLayout.addWidget(self.statusLabel, 1, 0, 1, 3)
+        self.cleanupButton = QtWidgets.QToolButton(ModuleWidget)
+        icon2 = QtGui.QIcon()
+        icon2.addPixmap(QtGui.QPixmap(os.path.join(_ui_dir, "../../artwork/icons/oxygen/22x22/edit-clear.png")), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.cleanupButton.setIcon(icon2)
+        self.cleanupButton.setObjectName("cleanupButton")
+        self.gridLayout.addWidget(self.cleanupButton, 0, 3, 1, 1)
+
+        self.retranslateUi(ModuleWidget)
+        QtCore.QMetaObject.connectSlotsByName(ModuleWidget)
+
+    def retranslateUi(self, ModuleWidget):
+        _translate = QtCore.QCoreApplication.translate
+        ModuleWidget.setWindowTitle(_translate("ModuleWidget", "Form"))
+        self.deactivateButton.setToolTip(_translate("ModuleWidget", "Deactivate module"))
+        self.deactivateButton.setText(_translate("ModuleWidget", "..."))
+        self.reloadButton.setToolTip(_translate("ModuleWidget", "Reload module"))
+        self.reloadButton.setText(_translate("ModuleWidget", "..."))
+        self.loadButton.setToolTip(_translate("ModuleWidget", "Load this module and all its dependencies"))
+        self.loadButton.setText(_translate("ModuleWidget", "Load something."))
+        self.statusLabel.setText(_translate("ModuleWidget", "Module status goes here."))
+        self.cleanupButton.setToolTip(_translate("ModuleWidget", "Clean up module status file"))
+        self.cleanupButton.setText(_translate("ModuleWidget", "..."))
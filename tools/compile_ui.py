@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+Compile Qt Designer *.ui files into Python modules usable with qtpy.
+
+The modules are generated with pyuic5 and then adapted:
+  - the PyQt5 import is replaced by qtpy, so any supported Qt binding works
+  - relative icon paths are resolved against the directory of the module,
+    like uic.loadUi does for the directory of the *.ui file
+
+Usage (from the Qudi main directory):
+    python tools/compile_ui.py [file.ui ...]
+
+Without arguments, all *.ui files that have a compiled module are rebuilt.
+
+Qudi is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Qudi is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Qudi. If not, see <http://www.gnu.org/licenses/>.
+
+Copyright (c) the Qudi Developers. See the COPYRIGHT.txt file at the
+top-level directory of this distribution and at <https://github.com/Ulm-IQO/qudi/>
+"""
+
+import io
+import os
+import re
+import sys
+
+from PyQt5 import uic
+
+# *.ui files that are compiled into Python modules
+UI_FILES = [
+    'gui/manager/ui_about.ui',
+    'gui/manager/ui_console_settings.ui',
+    'gui/manager/ui_manager_window.ui',
+    'gui/manager/ui_module_widget.ui',
+]
+
+PYUIC_WARNING = (
+    '# WARNING: Any manual changes made to this file will be lost when pyuic5 is\n'
+    '# run again.  Do not edit this file unless you know what you are doing.\n')
+
+WARNING = (
+    '# WARNING: Any manual changes made to this file will be lost when\n'
+    '# tools/compile_ui.py is run again. Do not run pyuic5 directly, the\n'
+    '# script adapts its output to qtpy and to relative icon paths.\n')
+
+PYQT_IMPORT = 'from PyQt5 import QtCore, QtGui, QtWidgets\n'
+
+QTPY_IMPORT = (
+    'import os\n'
+    '\n'
+    'from qtpy import QtCore, QtGui, QtWidgets\n'
+    '\n'
+    '# icon paths in the .ui file are relative to its directory\n'
+    '_ui_dir = os.path.dirname(__file__)\n')
+
+
+def compile_ui(ui_file):
+    """ Compile a *.ui file into a Python module next to it.
+
+      @param str ui_file: path to the *.ui file
+
+      @return str: path of the written Python module
+    """
+    py_file = os.path.splitext(ui_file)[0] + '.py'
+    code = io.StringIO()
+    with open(ui_file, 'r') as f:
+        uic.compileUi(f, code)
+    code = code.getvalue()
+    for old, new in ((PYUIC_WARNING, WARNING), (PYQT_IMPORT, QTPY_IMPORT)):
+        if old not in code:
+            raise Exception('Unexpected pyuic5 output for {0}, missing:\n{1}'
+                            ''.format(ui_file, old))
+        code = code.replace(old, new)
+    code = re.sub(r'QtGui\.QPixmap\("([^"]+)"\)',
+                  r'QtGui.QPixmap(os.path.join(_ui_dir, "\1"))',
+                  code)
+    with open(py_file, 'w') as f:
+        f.write(code)
+    return py_file
+
+
+if __name__ == '__main__':
+    for ui_file in sys.argv[1:] or UI_FILES:
+        print('{0} -> {1}'.format(ui_file, compile_ui(ui_file)))